@@ -0,0 +1,9 @@
+"""Constants shared between the GUI and the conversion pipeline."""
+
+# Supported values for the ``choix_optim`` field
+CHOIX_OPTIM_VALUES = [
+    "CoutEnergie",
+    "LissagePuissance",
+    "Supervision",
+    "LLLP",
+]
@@ -1,12 +1,14 @@
+import json
+import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext, ttk
 from pathlib import Path
-from tkcalendar import DateEntry
 
-# Import the main conversion function and constants
-from .main import main, CHOIX_OPTIM_VALUES
+# The conversion function itself is imported lazily in _do_convert so the
+# window appears before pandas/openpyxl are loaded.
 from . import utils
-from .mapper import DEFAULT_BATTERY_PROFILE, DATA_DIR as MAPPER_DATA_DIR
+from .constants import CHOIX_OPTIM_VALUES
+from .utils import DEFAULT_BATTERY_PROFILE, DATA_DIR
 
 # Mapping of field keys to expected input types for hints
 TYPE_HINTS = {
@@ -30,10 +32,60 @@ TYPE_HINTS = {
     "output": "path",
 }
 
+# Coercers applied to the raw widget values, keyed by the TYPE_HINTS entries
+COERCERS = {
+    "path": lambda s: s or None,
+    "YYYY-MM-DD": lambda s: s or None,
+    "int": lambda s: int(s) if s else None,
+    "list[int]": lambda v: [int(x) for x in v],
+    "str": lambda s: s or None,
+}
+
+# Last-used directories of the file dialogs, persisted between sessions
+LAST_DIR_FILE = Path.home() / ".x2j_gui.json"
+
+# Notebook layout: one tab per group, built once at import time
+GROUP_SPEC = (
+    (
+        "Fichiers",
+        (
+            ("Resultat (.xlsx)", "resultat", "file_input"),
+            ("Profil Batterie (.xlsx)", "battery_profile_path", "file_input"),
+            ("Données Camions (.xlsx)", "donnees_camions_path", "file_input"),
+            ("Infratructure", "infrastructure_path", "file_input"),
+            ("Start Date", "start", "date"),
+            ("End Date", "end", "date"),
+            ("Maximum Exec Temps", "maximum_exec_temps", "entry"),
+            ("Output (.json)", "output", "file_output"),
+        ),
+    ),
+    (
+        "Simulation",
+        (
+            ("Choix Optim", "choix_optim", "combo", CHOIX_OPTIM_VALUES),
+            ("Projection", "projection", "combo", [0, 2, 5, 10]),
+            ("Marge Sécurité", "marge_securite", "entry"),
+            ("Marge Préchauffage", "marge_prechauffage", "entry"),
+            ("Temps Chargement", "temps_chargement", "entry"),
+            ("Temps Déchargement", "temps_dechargement", "entry"),
+            ("Axe Optim Degrade", "axe_optim_degrade", "listorder"),
+            ("Pas de Temps", "pas_de_temps", "entry"),
+        ),
+    ),
+    (
+        "Infrastructure",
+        (
+            ("SOC Cible", "soc_cible", "entry"),
+            ("Diminution SOC", "diminution_soc", "entry"),
+        ),
+    ),
+)
+
 class App(tk.Tk):
     def __init__(self):
         super().__init__()
         self.title("X2J")
+        self._last_dir = self._load_last_dirs()
         self.option_add("*Font", ("Segoe UI", 10))
         style = ttk.Style(self)
         style.theme_use("clam")
@@ -61,63 +113,28 @@ class App(tk.Tk):
         self.notebook = ttk.Notebook(self.main)
         self.notebook.pack(fill="both", expand=True)
 
-        # Groupes de champs
-        groups = [
-            (
-                "Fichiers",
-                [
-                    ("Resultat (.xlsx)", "resultat", "file_input"),
-                    ("Profil Batterie (.xlsx)", "battery_profile_path", "file_input"),
-                    ("Données Camions (.xlsx)", "donnees_camions_path", "file_input"),
-                    ("Infratructure", "infrastructure_path", "file_input"),
-                    ("Start Date", "start", "date"),
-                    ("End Date", "end", "date"),
-                    ("Maximum Exec Temps", "maximum_exec_temps", "entry"),
-                    ("Output (.json)", "output", "file_output"),
-                ],
-            ),
-            (
-                "Simulation",
-                [
-                    ("Choix Optim", "choix_optim", "combo", CHOIX_OPTIM_VALUES),
-                    ("Projection", "projection", "combo", [0, 2, 5, 10]),
-                    ("Marge Sécurité", "marge_securite", "entry"),
-                    ("Marge Préchauffage", "marge_prechauffage", "entry"),
-                    ("Temps Chargement", "temps_chargement", "entry"),
-                    ("Temps Déchargement", "temps_dechargement", "entry"),
-                    ("Axe Optim Degrade", "axe_optim_degrade", "listorder"),
-                    ("Pas de Temps", "pas_de_temps", "entry"),
-
-                ],
-            ),
-            (
-                "Infrastructure",
-                [
-                    ("SOC Cible", "soc_cible", "entry"),
-                    ("Diminution SOC", "diminution_soc", "entry"),
-                ],
-            ),
-        ]
-
         self.widgets = {}
         default_values = self._get_default_values()
 
-        for group_name, params in groups:
+        for group_name, params in GROUP_SPEC:
             frame = ttk.Frame(self.notebook, padding=(10, 10))
             frame.columnconfigure(1, weight=1)
             self.notebook.add(frame, text=group_name)
 
             for i, (label_text, key, wtype, *extra) in enumerate(params):
                 ttk.Label(frame, text=label_text).grid(row=i, column=0, sticky="e", padx=5, pady=3)
-                widget = self._create_widget(frame, wtype, key, extra, default_values)
-                widget.grid(row=i, column=1, sticky="w", padx=5, pady=3)
+                container, input_widget = self._create_widget(frame, wtype, key, extra, default_values)
+                container.grid(row=i, column=1, sticky="w", padx=5, pady=3)
                 hint_btn = ttk.Button(frame, text="?", width=2, command=lambda k=key: self._show_hint(k))
                 hint_btn.grid(row=i, column=2, sticky="w", padx=5)
-                self.widgets[key] = widget
+                self.widgets[key] = input_widget
 
-        ttk.Button(self.main, text="Convert", command=self._run_conversion).pack(pady=15)
+        self.convert_btn = ttk.Button(self.main, text="Convert", command=self._run_conversion)
+        self.convert_btn.pack(pady=15)
+        self.progress = ttk.Progressbar(self.main, mode="indeterminate")
 
     def _create_widget(self, parent, wtype, key, extra, defaults):
+        """Build the widget for ``key`` and return ``(container, input_widget)``."""
         # Widgets pour fichier
         if wtype in ("file_input", "file_output"):
             frame = ttk.Frame(parent)
@@ -128,11 +145,12 @@ class App(tk.Tk):
             btn.pack(side="left", padx=5)
             if defaults.get(key):
                 entry.insert(0, defaults[key])
-            frame.widget = entry
-            return frame
+            return frame, entry
 
         # Widget date
         if wtype == "date":
+            from tkcalendar import DateEntry
+
             widget = DateEntry(
                 parent,
                 width=12,
@@ -143,7 +161,7 @@ class App(tk.Tk):
             )
             if defaults.get(key):
                 widget.set_date(defaults[key])
-            return widget
+            return widget, widget
 
         # Combo
         if wtype == "combo":
@@ -154,7 +172,7 @@ class App(tk.Tk):
                 widget.current(values.index(default))
             except ValueError:
                 widget.current(0)
-            return widget
+            return widget, widget
 
         # Listorder
         if wtype == "listorder":
@@ -167,20 +185,19 @@ class App(tk.Tk):
             ttk.Button(btn_frame, text="↓", width=2, command=lambda lb=listbox: self._move_list_item(lb, 1)).pack(fill="x")
             for v in defaults.get(key, []):
                 listbox.insert("end", v)
-            frame.widget = listbox
-            return frame
+            return frame, listbox
 
         # Entrée texte
         widget = ttk.Entry(parent, width=20)
         if defaults.get(key) is not None:
             widget.insert(0, str(defaults[key]))
-        return widget
+        return widget, widget
 
     def _get_default_values(self):
         return {
             'resultat': str(utils.DEFAULT_RESULTAT_SIMU),
             'battery_profile_path': str(DEFAULT_BATTERY_PROFILE),
-            'donnees_camions_path': str(MAPPER_DATA_DIR / 'donnees_camions.xlsx'),
+            'donnees_camions_path': str(DATA_DIR / 'donnees_camions.xlsx'),
             'projection': 0,
             'pas_de_temps': 15,
             'temps_chargement': 30,
@@ -194,12 +211,36 @@ class App(tk.Tk):
             'choix_optim': CHOIX_OPTIM_VALUES[0],
         }
 
+    @staticmethod
+    def _load_last_dirs() -> dict:
+        try:
+            return json.loads(LAST_DIR_FILE.read_text(encoding="utf-8"))
+        except Exception:
+            return {}
+
+    def _save_last_dirs(self) -> None:
+        try:
+            LAST_DIR_FILE.write_text(json.dumps(self._last_dir), encoding="utf-8")
+        except Exception:
+            pass
+
+    def _initial_dir(self, key: str) -> str:
+        cached = self._last_dir.get(key)
+        if cached:
+            return cached
+        current = self.widgets[key].get()
+        if current:
+            return str(Path(current).parent)
+        return str(Path.home())
+
     def _browse_file(self, key: str):
+        initialdir = self._initial_dir(key)
         if key == 'output':
             path = filedialog.asksaveasfilename(
                 defaultextension=".json",
                 filetypes=[("JSON Files", "*.json")],
-                title="Select output JSON file"
+                title="Select output JSON file",
+                initialdir=initialdir,
             )
         else:
             if key == 'infrastructure_path':
@@ -208,11 +249,13 @@ class App(tk.Tk):
                 filetypes = [("Excel Files", "*.xlsx *.xls")]
             path = filedialog.askopenfilename(
                 filetypes=filetypes,
-                title="Select file"
+                title="Select file",
+                initialdir=initialdir,
             )
         if path:
-            widget = self.widgets[key]
-            entry = getattr(widget, 'widget', widget)
+            self._last_dir[key] = str(Path(path).parent)
+            self._save_last_dirs()
+            entry = self.widgets[key]
             entry.delete(0, tk.END)
             entry.insert(0, path)
 
@@ -248,11 +291,17 @@ class App(tk.Tk):
         self.config(menu=menubar)
 
     def _show_schema(self):
+        # The schema file is static: read it once and reuse the same window
+        win = getattr(self, '_schema_win', None)
+        if win is not None:
+            win.deiconify()
+            win.lift()
+            return
         try:
-            root_dir = Path(__file__).resolve().parent.parent
-            schema_path = root_dir / 'docs' / 'json_scheme.txt'
-            with open(schema_path, 'r', encoding='utf-8') as f:
-                schema_text = f.read()
+            if not hasattr(self, '_schema_text'):
+                root_dir = Path(__file__).resolve().parent.parent
+                schema_path = root_dir / 'docs' / 'json_scheme.txt'
+                self._schema_text = schema_path.read_text(encoding='utf-8')
         except Exception as e:
             messagebox.showerror("Error", f"Cannot load schema: {e}")
             return
@@ -260,45 +309,60 @@ class App(tk.Tk):
         win.title("JSON Template")
         text_widget = scrolledtext.ScrolledText(win, width=80, height=30)
         text_widget.pack(fill='both', expand=True, padx=5, pady=5)
-        text_widget.insert('1.0', schema_text)
+        text_widget.insert('1.0', self._schema_text)
         text_widget.configure(state='disabled')
+        win.protocol("WM_DELETE_WINDOW", win.withdraw)
+        self._schema_win = win
 
     def _run_conversion(self):
         inputs = {}
         for key, widget in self.widgets.items():
-            entry = getattr(widget, 'widget', widget)
-            if isinstance(entry, tk.Listbox):
-                values = entry.get(0, tk.END)
-                inputs[key] = [int(v) for v in values]
+            if isinstance(widget, tk.Listbox):
+                inputs[key] = [int(v) for v in widget.get(0, tk.END)]
             else:
-                entry = getattr(widget, 'widget', widget)
-                inputs[key] = entry.get()
+                inputs[key] = widget.get()
 
         try:
             kwargs = {
-                'battery_profile_path': inputs['battery_profile_path'] or None,
-                'donnees_camions_path': inputs['donnees_camions_path'] or None,
-                'start': inputs['start'],
-                'end': inputs['end'],
-                'projection': int(inputs['projection']),
-                'soc_cible': int(inputs['soc_cible']) if inputs['soc_cible'] else None,
-                'marge_securite': inputs['marge_securite'] or None,
-                'marge_prechauffage': inputs['marge_prechauffage'] or None,
-                'diminution_soc': int(inputs['diminution_soc']) if inputs['diminution_soc'] else None,
-                'maximum_exec_temps': int(inputs['maximum_exec_temps']) if inputs['maximum_exec_temps'] else None,
-                'pas_de_temps': int(inputs['pas_de_temps']) if inputs['pas_de_temps'] else None,
-                'temps_chargement': int(inputs['temps_chargement']) if inputs['temps_chargement'] else None,
-                'temps_dechargement': int(inputs['temps_dechargement']) if inputs['temps_dechargement'] else None,
-                'infrastructure_path': inputs.get('infrastructure_path') or None,
-                'output': inputs['output'],
-                'axe_optim_degrade': inputs.get('axe_optim_degrade'),
-                'choix_optim': inputs.get('choix_optim'),
+                key: COERCERS[TYPE_HINTS[key]](value)
+                for key, value in inputs.items()
             }
-
-            main(inputs['resultat'], **kwargs)
-            messagebox.showinfo("Success", "Conversion completed successfully.")
         except Exception as e:
             messagebox.showerror("Error", f"Conversion failed: {e}")
+            return
+
+        resultat = kwargs.pop('resultat') or utils.DEFAULT_RESULTAT_SIMU
+        # Empty fields fall back to the defaults of main()
+        kwargs = {key: value for key, value in kwargs.items() if value is not None}
+
+        # Run the conversion off the Tk main thread so the UI stays responsive
+        self.convert_btn.config(state="disabled")
+        self.progress.pack(pady=(0, 10))
+        self.progress.start(10)
+        threading.Thread(
+            target=self._do_convert,
+            args=(resultat, kwargs),
+            daemon=True,
+        ).start()
+
+    def _do_convert(self, resultat, kwargs):
+        try:
+            from .main import main
+
+            main(resultat, **kwargs)
+        except Exception as e:
+            self.after(0, self._finish_conversion, e)
+        else:
+            self.after(0, self._finish_conversion, None)
+
+    def _finish_conversion(self, error):
+        self.progress.stop()
+        self.progress.pack_forget()
+        self.convert_btn.config(state="normal")
+        if error is None:
+            messagebox.showinfo("Success", "Conversion completed successfully.")
+        else:
+            messagebox.showerror("Error", f"Conversion failed: {error}")
 
 
 if __name__ == "__main__":
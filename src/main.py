@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Iterable, List, Dict, Any
 
 import pandas as pd
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 from . import utils
 from .transformer import add_next_service_time, compute_soc
 from .mapper import (
@@ -19,20 +26,18 @@ from .mapper import (
     DATA_DIR as MAPPER_DATA_DIR,
 )
 from .validator import validate_json
-
-# Supported values for the ``choix_optim`` field
-CHOIX_OPTIM_VALUES = [
-    "CoutEnergie",
-    "LissagePuissance",
-    "Supervision",
-    "LLLP",
-]
+from .constants import CHOIX_OPTIM_VALUES
 
 def _parse_date(value: str | float | int | None) -> datetime | None:
     """Return a :class:`datetime` from an ISO string or Excel serial number."""
 
     if value is None:
         return None
+    return _parse_date_cached(value)
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_date_cached(value: str | float | int) -> datetime | None:
     if isinstance(value, (int, float)):
         return utils.excel_number_to_datetime(float(value))
     try:
@@ -45,29 +50,56 @@ def _parse_date(value: str | float | int | None) -> datetime | None:
 
 
 def _filter_by_jour_dep(
-    records: Iterable[Dict[str, Any]],
-    start: datetime | None,
-    end: datetime | None,
+    df: pd.DataFrame,
+    start_serial: float | None,
+    end_serial: float | None,
     *,
     jour_col: str = "jourDep",
-) -> List[Dict[str, Any]]:
-    """Return records with ``jour_col`` within ``start`` and ``end``."""
+) -> pd.DataFrame:
+    """Return the rows with ``jour_col`` within the Excel-serial bounds.
 
-    if start is None and end is None:
-        return list(records)
+    ``jourDep`` already holds Excel serial numbers, so the comparison stays
+    in serial space instead of converting every row back to ``datetime``.
+    """
+
+    if start_serial is None and end_serial is None:
+        return df
+    if jour_col not in df.columns:
+        return df.iloc[0:0]
+
+    # Unparsable jourDep values turn into NaN and drop out through the mask,
+    # so no per-row exception handling is needed.
+    jours = pd.to_numeric(df[jour_col], errors="coerce")
+    mask = jours.notna()
+    if start_serial is not None:
+        mask &= jours >= start_serial
+    if end_serial is not None:
+        mask &= jours <= end_serial
+    return df[mask]
 
-    filtered: List[Dict[str, Any]] = []
-    for rec in records:
-        try:
-            jour_dt = utils.excel_number_to_datetime(float(rec.get(jour_col, 0)))
-        except Exception:
-            continue
-        if start and jour_dt < start:
-            continue
-        if end and jour_dt > end:
-            continue
-        filtered.append(rec)
-    return filtered
+
+def _write_if_changed(output_path: Path, payload: bytes) -> None:
+    """Write ``payload`` to ``output_path`` unless its content is unchanged.
+
+    The existing file itself is compared, so an output edited or replaced
+    externally is always rewritten; back-to-back conversions with
+    identical results skip the write.  The write goes through a temporary
+    file and ``os.replace`` so a partial file is never visible.
+    """
+
+    try:
+        if output_path.read_bytes() == payload:
+            return
+    except OSError:
+        pass
+    tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, output_path)
 
 
 def main(
@@ -130,21 +162,26 @@ def main(
     map_resultat_path = Path(resultat_simu_path) if resultat_simu_path else resultat_path
 
     # ------------------------------------------------------------------
-    # 1. Read the Excel records
-    records = utils.load_resultat_simu(resultat_path, mode=mode)
+    # 1. Read the Excel records as a single DataFrame
+    df = utils.load_resultat_simu_df(resultat_path, mode=mode)
 
     # ------------------------------------------------------------------
-    # 2. Filter on ``jourDep`` 
+    # 2. Filter on ``jourDep``
     start_dt = _parse_date(start)
     end_dt = _parse_date(end)
-    records = _filter_by_jour_dep(records, start_dt, end_dt)
+    start_serial = (
+        utils.datetime_to_excel_number(start_dt) if start_dt is not None else None
+    )
+    end_serial = (
+        utils.datetime_to_excel_number(end_dt) if end_dt is not None else None
+    )
+    df = _filter_by_jour_dep(df, start_serial, end_serial)
 
-    if not records:
+    if df.empty:
         return []
 
     # ------------------------------------------------------------------
     # 3. Transformations
-    df = pd.DataFrame(records)
     df = add_next_service_time(df)
     conso_tbl = utils._load_donnees_camions_conso()
     capacite_tbl = utils._load_donnees_camions()
@@ -191,9 +228,13 @@ def main(
         output_path = Path(output)
         if output_path.is_dir():
             output_path = output_path / "result.json"
-        output_path.write_text(
-            json.dumps(json_output, ensure_ascii=False, indent=2)
-        )
+        if orjson is not None:
+            payload = orjson.dumps(json_output, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(
+                json_output, ensure_ascii=False, indent=2
+            ).encode("utf-8")
+        _write_if_changed(output_path, payload)
 
     return json_output
 
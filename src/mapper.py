@@ -3,9 +3,13 @@ Mapper module with fully populated internal default JSON template.
 """
 
 from __future__ import annotations
+import functools
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from copy import deepcopy
+from itertools import chain
 from pathlib import Path
 from typing import Dict, Iterable, List, Tuple, Any, Mapping
 
@@ -16,7 +20,22 @@ try:
 except Exception:
     pd = None
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+if orjson is not None:
+    def _dumps(obj: Any) -> str:
+        """Serialize ``obj`` to a JSON string through orjson."""
+        return orjson.dumps(obj).decode()
+else:
+    def _dumps(obj: Any) -> str:
+        """Serialize ``obj`` to a JSON string through the stdlib encoder."""
+        return json.dumps(obj, ensure_ascii=False)
+
 from src.utils import (
+    EXCEL_EPOCH,
     load_battery_profile,
     _load_donnees_camions,
     _load_donnees_camions_puissance,
@@ -215,9 +234,77 @@ DEFAULT_TEMPLATE: Dict = {
 }
 
 
+
+def _fast_clone(value: Any) -> Any:
+    """Recursively copy a template structure of dicts, lists and atoms.
+
+    The templates only nest dicts and lists around immutable scalars, so the
+    memo table and dispatch machinery of :func:`copy.deepcopy` (and the
+    serializer of a json round-trip) are unnecessary; scalars are shared.
+    """
+    if isinstance(value, dict):
+        return {k: _fast_clone(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_fast_clone(v) for v in value]
+    return value
+
+
+def _for_projection(table: Mapping, projection: int) -> Dict[str, float]:
+    """Return a flat ``{modele: value}`` view of ``table`` for one projection.
+
+    Hashing only the model string beats hashing a ``(projection, modele)``
+    tuple on every lookup when the projection is fixed for a whole batch.
+    """
+    return {m: v for (p, m), v in table.items() if p == projection}
+
+
+def _to_hhmm(minutes: int) -> str:
+    """Format a duration in minutes as ``HH:MM``."""
+    hours, mins = divmod(int(minutes), 60)
+    return f"{hours:02d}:{mins:02d}"
+
+
+def _flatten_chargeurs(infra: Dict) -> List[Dict]:
+    """Return every charger of ``infra`` that has at least one plug."""
+    return [
+        ch
+        for src in infra.get("sources", [])
+        for trans in src.get("transformateurs", [])
+        for ch in trans.get("chargeurs", [])
+        if ch.get("prises")
+    ]
+
+
+def _compute_debut_optim(start_dt: str | datetime, min_jour: datetime) -> str:
+    """Return the ``debutOptim`` ISO string clamped to the jourDep lower bound."""
+    debut_dt = parse_iso_datetime(start_dt)
+    bound = (min_jour - timedelta(days=3)).date()
+    if debut_dt.date() < bound:
+        debut_dt = datetime.combine(bound, datetime.max.time())
+    # Arrondir les microsecondes à la seconde la plus proche
+    if debut_dt.microsecond >= 500_000:
+        debut_dt = debut_dt + timedelta(seconds=1)
+    debut_dt = debut_dt.replace(microsecond=0)
+    return isoformat_z(debut_dt)
+
+
+def _compute_fin_optim(end_dt: str | datetime, max_jour: datetime) -> str:
+    """Return the ``finOptim`` ISO string clamped to the jourDep upper bound."""
+    fin_dt = parse_iso_datetime(end_dt)
+    bound = (max_jour + timedelta(days=3)).date()
+    if fin_dt.date() > bound:
+        fin_dt = datetime.combine(bound, datetime.min.time())
+    return isoformat_z(fin_dt)
+
+
 def _load_template(_: Path | None = None) -> Dict:
-    """Return a fresh deepcopy of the internal template."""
-    return deepcopy(DEFAULT_TEMPLATE)
+    """Return a fresh copy of the internal template."""
+    return _fast_clone(DEFAULT_TEMPLATE)
+
+
+def _clone_template(template: Dict) -> Dict:
+    """Return a fresh copy of ``template`` for one record."""
+    return _fast_clone(template)
 
 def build_chargeurs(
     records: Iterable[Dict],
@@ -229,31 +316,46 @@ def build_chargeurs(
     """Return a list of charger definitions for all unique vehicles."""
     seen: set[str] = set()
     chargeurs: List[Dict] = []
-    ch_template = template.get("sources", [{}])[0].get("transformateurs", [{}])[0].get("chargeurs", [{}])[0]
+
+    # Inherit the charger/prise shapes from the caller's template once and
+    # pre-apply the overrides that do not vary per vehicle; each charger
+    # then starts from a shallow copy and only the per-vehicle fields are
+    # set in the loop.  Inherited values such as the rendement curve are
+    # shared with the template because they are never mutated.
+    ch_template = (
+        template.get("sources", [{}])[0]
+        .get("transformateurs", [{}])[0]
+        .get("chargeurs", [{}])[0]
+    )
     prise_template = ch_template.get("prises", [{}])[0]
+    base_chargeur = dict(ch_template)
+    base_chargeur.update(
+        etat="online",
+        pMax=int(chargeur_pmax or 0),
+        typeChargeur="TypeChargeur_valeur",
+    )
+    base_prise = dict(prise_template)
+    base_prise.update(
+        etat="online",
+        typePrise="Type Prise",
+        pMax=int(prise_pmax or 0.0),
+    )
 
     for idx, rec in enumerate(records):
         veh = str(rec.get("newIdVeh", "")).strip()
         if not veh or veh in seen:
             continue
         seen.add(veh)
-        chargeur = deepcopy(ch_template)
-        chargeur.update({
-            "id": f"TR1_CH_{idx}",
-            "libelle": f"TR1_CH_{idx}",
-            "etat": "online",
-            "pMax": int(chargeur_pmax or 0),
-            "typeChargeur": str("TypeChargeur_valeur"),
-            "mutualisation": {"nombrePrises": 1, "configsMutualisation": [{"configMutualisation": [100]}]},
-        })
-        prise = deepcopy(prise_template)
-        prise.update({
-            "id": f"PR_{veh or idx}",
-            "libelle": f"TR1_CH_{idx}_P1",
-            "etat": "online",
-            "typePrise": str("Type Prise"),
-            "pMax": int(prise_pmax or 0.0),
-        })
+        chargeur = dict(base_chargeur)
+        chargeur["id"] = f"TR1_CH_{idx}"
+        chargeur["libelle"] = f"TR1_CH_{idx}"
+        chargeur["mutualisation"] = {
+            "nombrePrises": 1,
+            "configsMutualisation": [{"configMutualisation": [100]}],
+        }
+        prise = dict(base_prise)
+        prise["id"] = f"PR_{veh or idx}"
+        prise["libelle"] = f"TR1_CH_{idx}_P1"
         chargeur["prises"] = [prise]
         chargeurs.append(chargeur)
 
@@ -282,17 +384,35 @@ def map_record(
     axe_optim_degrade: List[int] | None = None,
     choix_optim: str | None = "",
     default_debut_service: str | datetime | None = "2050-01-01T23:59:59Z",
+    _capacities: Mapping | None = None,
+    _powers: Mapping | None = None,
+    _conso: Mapping | None = None,
+    _profile: List[Dict] | None = None,
+    _profile_max_y: int | None = None,
+    _jour_bounds: Tuple[datetime, datetime] | None = None,
+    _infra: Dict | None = None,
+    _chargers: List[Dict] | None = None,
+    _prise_lists: List[List[Dict]] | None = None,
+    _scaled_profiles: Dict | None = None,
+    _debut_iso: str | None = None,
+    _fin_iso: str | None = None,
+    _default_debut_iso: str | None = None,
+    _hfin: datetime | None = None,
+    _next_service: datetime | None = None,
+    _marge_sec_hhmm: str | None = None,
+    _marge_pre_hhmm: str | None = None,
 ) -> Dict:
     """
     Convert a single record row to the target JSON structure.
     """
-    data = deepcopy(template)
+    data = _clone_template(template)
 
 #---Choix Optim -----------------------------------------------------------------------------------------
     data["choix_optim"] = choix_optim
 #---Configuration ---------------------------------------------------------------------------------------
-    config_template = template.get("configuration")
-    configuration = deepcopy(config_template)
+    # ``data`` is already a fresh copy, so its sub-structures can be mutated
+    # in place without further copies.
+    configuration = data.get("configuration")
 
     #configuration.activationRendement
     if activation_rendement is not None:
@@ -312,69 +432,71 @@ def map_record(
     configuration["maximumExecTemps"] = int(maximum_exec_temps)
 
     # compute the jourDep bounds once for both start and end date handling
-    min_jour, max_jour = jour_dep_bounds(resultat_simu_path)
+    if _jour_bounds is not None:
+        min_jour, max_jour = _jour_bounds
+    else:
+        min_jour, max_jour = jour_dep_bounds(resultat_simu_path)
 
     # configuration.debutOptim
-    if start_dt is not None:
-        debut_dt = parse_iso_datetime(start_dt)
-        bound = (min_jour - timedelta(days=3)).date()
-        if debut_dt.date() < bound:
-            debut_dt = datetime.combine(bound, datetime.max.time())
-        # Arrondir les microsecondes à la seconde la plus proche
-        if debut_dt.microsecond >= 500_000:
-            debut_dt = debut_dt + timedelta(seconds=1)
-        debut_dt = debut_dt.replace(microsecond=0)
-        configuration["debutOptim"] = isoformat_z(debut_dt)
+    if _debut_iso is not None:
+        configuration["debutOptim"] = _debut_iso
+    elif start_dt is not None:
+        configuration["debutOptim"] = _compute_debut_optim(start_dt, min_jour)
 
     # configuration.finOptim
-    if end_dt is not None:
-        fin_dt = parse_iso_datetime(end_dt)
-        bound = (max_jour + timedelta(days=3)).date()
-        if fin_dt.date() > bound:
-            fin_dt = datetime.combine(bound, datetime.min.time())
-        configuration["finOptim"] = isoformat_z(fin_dt)
+    if _fin_iso is not None:
+        configuration["finOptim"] = _fin_iso
+    elif end_dt is not None:
+        configuration["finOptim"] = _compute_fin_optim(end_dt, max_jour)
 
 
 
     data["configuration"] = configuration
 
 #---Sources ---------------------------------------------------------------------------------------------
-    infra = None
-    if infrastructure_path is not None:
+    infra = _infra
+    if infra is None and infrastructure_path is not None:
         try:
             infra = load_infrastructure(infrastructure_path)
         except Exception:
             infra = None
-        
+
     if infra is not None:
         data["sources"] = infra.get("sources", [])
     else:
         data["sources"] = []
 
 #---Vehicules -------------------------------------------------------------------------------------------
-    veh_template = template.get("vehicules", [{}])[0]
-    vehicule = deepcopy(veh_template)
+    vehicule = data.get("vehicules", [{}])[0]
     new_id = str(record.get("newIdVeh", "")).strip() or None
     
  #vehicules.vehicule.capaciteBatterie
-    capacities = _load_donnees_camions(donnees_camions_path)
+    proj = int(projection)
+    capacities = (
+        _capacities
+        if _capacities is not None
+        else _for_projection(_load_donnees_camions(donnees_camions_path), proj)
+    )
     tveh = (record.get("tVeh") or "").strip()
-    vehicule["capaciteBatterie"] = int(capacities.get((int(projection), tveh), 0))
+    vehicule["capaciteBatterie"] = int(capacities.get(tveh, 0))
 
     #vehicules.vehicule.idPrise
     vehicule["idPrise"] = ""
     if infra is not None:
-        # Flatten all available chargers with at least one plug
-        chargers: List[Dict[str, Any]] = []
-        for src in infra.get("sources", []):
-            for trans in src.get("transformateurs", []):
-                for ch in trans.get("chargeurs", []):
-                    if ch.get("prises"):
-                        chargers.append(ch)
+        # Flatten all available chargers with at least one plug.  When called
+        # from ``map_records`` the flattened lists arrive pre-built, so the
+        # triple loop runs once per batch instead of once per record.
+        if _chargers is not None:
+            chargers = _chargers
+            prise_lists = _prise_lists or []
+        else:
+            chargers = _flatten_chargeurs(infra)
+            prise_lists = [ch.get("prises", []) for ch in chargers]
 
         if chargers:
-            charger = random.choice(chargers)
-            prise = random.choice(charger.get("prises", []))
+            i = random.randrange(len(chargers))
+            charger = chargers[i]
+            prise = random.choice(prise_lists[i])
             vehicule["idPrise"] = prise.get("id", "")
             # Update charger and plug types from the infrastructure
             modele = charger.get("typeChargeur")
@@ -388,14 +510,36 @@ def map_record(
     vehicule["modeBoost"] = 0
     
     #vehicules.vehicule.profilBatterie
-    profile = load_battery_profile(battery_profile_path)
-    powers = _load_donnees_camions_puissance(donnees_camions_path)
-    power = powers.get((int(projection), tveh))
+    profile = (
+        _profile if _profile is not None else load_battery_profile(battery_profile_path)
+    )
+    powers = (
+        _powers
+        if _powers is not None
+        else _for_projection(_load_donnees_camions_puissance(donnees_camions_path), proj)
+    )
+    power = powers.get(tveh)
     if power is not None and profile:
-        max_y = max(p["y"] for p in profile)
-        if max_y:
-            alpha = power / max_y
-            profile = [{"x": int(p["x"]), "y": int(alpha * int(p["y"]))} for p in profile]
+        # Vehicles of the same model share one scaled profile list; the
+        # output is serialized as-is, so sharing is safe and avoids
+        # rebuilding the list of points for every record.
+        scaled = _scaled_profiles.get(power) if _scaled_profiles is not None else None
+        if scaled is None:
+            max_y = (
+                _profile_max_y
+                if _profile_max_y is not None
+                else max(p["y"] for p in profile)
+            )
+            if max_y:
+                alpha = power / max_y
+                scaled = [
+                    {"x": int(p["x"]), "y": int(alpha * int(p["y"]))} for p in profile
+                ]
+            else:
+                scaled = profile
+            if _scaled_profiles is not None:
+                _scaled_profiles[power] = scaled
+        profile = scaled
     vehicule["profilBatterie"] = profile
 
     #vehicules.vehicule.soc
@@ -412,20 +556,8 @@ def map_record(
         vehicule["socCible"] = int(soc_cible)
 
     #vehicules.vehicule.dureeService
-    def _dt(value):
-        if isinstance(value, datetime):
-            return value
-        if value in (None, ""):
-            return None
-        try:
-            return datetime.fromisoformat(str(value))
-        except Exception:
-            pass
-        try:
-            return excel_number_to_datetime(float(value))
-        except Exception:
-            return None
-    h_fin = _dt(record.get("hFin"))
+    _dt = _coerce_dt
+    h_fin = _hfin if _hfin is not None else _dt(record.get("hFin"))
     dist = record.get("dist")
     try:
         dist_val = int(dist)
@@ -442,7 +574,11 @@ def map_record(
     else:
         vehicule["finService"] = ""
     #vehicules.vehicule.debutService
-    next_service = _dt(record.get("Heure Prochain Service"))
+    next_service = (
+        _next_service
+        if _next_service is not None
+        else _dt(record.get("Heure Prochain Service"))
+    )
     temps_charg = temps_chargement or 0
     marge_sec = record.get("MargeSécurité") or 0
     if next_service:
@@ -451,8 +587,12 @@ def map_record(
         )
         vehicule["debutService"] = isoformat_z(debut_service)
     elif default_debut_service is not None:
-        default_debut_service = (parse_iso_datetime(configuration["finOptim"]) + timedelta(days=1.5)).isoformat()
-        ds_val = default_debut_service
+        if _default_debut_iso is not None:
+            ds_val = _default_debut_iso
+        else:
+            ds_val = (
+                parse_iso_datetime(configuration["finOptim"]) + timedelta(days=1.5)
+            ).isoformat()
         if isinstance(ds_val, datetime):
             vehicule["debutService"] = isoformat_z(ds_val)
         else:
@@ -462,31 +602,45 @@ def map_record(
                 vehicule["debutService"] = str(ds_val)
 
     # vehicules.vehicule.libelle
-    conso_table = _load_donnees_camions_conso(donnees_camions_path)
-    conso_value = conso_table.get((int(projection), tveh), 0.0)
-
-    # Convert marge_securite (minutes) to HH:MM format
-    hours, minutes = divmod(int(marge_securite), 60)
-    marge_securite_hhmm = f"{hours:02d}:{minutes:02d}"
+    conso_table = (
+        _conso
+        if _conso is not None
+        else _for_projection(_load_donnees_camions_conso(donnees_camions_path), proj)
+    )
+    conso_value = conso_table.get(tveh, 0.0)
 
-    # Convert marge_prechauffage (minutes) to HH:MM format
-    hours, minutes = divmod(int(marge_prechauffage), 60)
-    marge_prechauffage_hhmm = f"{hours:02d}:{minutes:02d}"
+    # Convert the marges (minutes) to HH:MM format, reusing the strings
+    # precomputed by map_records when available
+    marge_securite_hhmm = _marge_sec_hhmm or _to_hhmm(marge_securite)
+    marge_prechauffage_hhmm = _marge_pre_hhmm or _to_hhmm(marge_prechauffage)
 
     #vehicules.vehicule.id
     if new_id is not None:
         vehicule["id"] = new_id
 
-    vehicule["libelle"] = json.dumps(
-        {
-            "numeroExploitation": f"{new_id}",
-            "debutService": vehicule.get("debutService", ""),
-            "MargeSecurite": marge_securite_hhmm,
-            "MargePrechauffage": marge_prechauffage_hhmm,
-            "Conso": round(conso_value, 2)
-        },
-        ensure_ascii=False,
-    )
+    # The libelle payload is five flat fields with known shapes, so an
+    # f-string skips the json encoder per record; _dumps remains the
+    # fallback whenever a field could need escaping.
+    debut_service = vehicule.get("debutService", "")
+    # Quotes, backslashes and control characters all need JSON escaping.
+    if any(c in '"\\' or c < " " for c in f"{new_id}{debut_service}"):
+        vehicule["libelle"] = _dumps(
+            {
+                "numeroExploitation": f"{new_id}",
+                "debutService": debut_service,
+                "MargeSecurite": marge_securite_hhmm,
+                "MargePrechauffage": marge_prechauffage_hhmm,
+                "Conso": round(conso_value, 2)
+            }
+        )
+    else:
+        vehicule["libelle"] = (
+            f'{{"numeroExploitation": "{new_id}", '
+            f'"debutService": "{debut_service}", '
+            f'"MargeSecurite": "{marge_securite_hhmm}", '
+            f'"MargePrechauffage": "{marge_prechauffage_hhmm}", '
+            f'"Conso": {round(conso_value, 2)}}}'
+        )
 
 
 
@@ -496,49 +650,130 @@ def map_record(
 
     return data
 
-def aggregate_results(results: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
-    """Combine per-vehicle structures into a single JSON object."""
+def aggregate_results(
+    results: Iterable[Dict[str, Any]],
+    *,
+    copy: bool = False,
+) -> Dict[str, Any]:
+    """Combine per-vehicle structures into a single JSON object.
+
+    The merge reuses ``results[0]`` as the output structure, so the first
+    item is mutated in place; pass ``copy=True`` to preserve it.
+    """
     results = list(results)
     if not results:
         return {}
-    merged = deepcopy(results[0])
-    merged["vehicules"] = []
-    chargeurs: List[Dict] = []
-    seen: set[str] = set()
+    merged = deepcopy(results[0]) if copy else results[0]
+
+    merged["vehicules"] = list(
+        chain.from_iterable(item.get("vehicules", ()) for item in results)
+    )
 
-    for item in results:
-        merged["vehicules"].extend(item.get("vehicules", []))
+    def _iter_chargeurs(item: Dict[str, Any]) -> Iterable[Dict]:
         src = item.get("sources")
         if not src:
-            continue
+            return ()
         trans = src[0].get("transformateurs")
         if not trans:
-            continue
-        ch_list = trans[0].get("chargeurs")
-        if not ch_list:
-            continue
-        for ch in ch_list:
-            ch_id = ch.get("id")
-            if ch_id and ch_id not in seen:
-                chargeurs.append(ch)
-                seen.add(ch_id)
+            return ()
+        return trans[0].get("chargeurs") or ()
+
+    # Deduplicate chargers by id in a single pass; insertion order is kept
+    # and a repeated id keeps its latest definition.
+    chargeurs = {
+        ch["id"]: ch
+        for item in results
+        for ch in _iter_chargeurs(item)
+        if ch.get("id")
+    }
 
     if merged.get("sources"):
-        merged["sources"][0]["transformateurs"][0]["chargeurs"] = chargeurs
+        merged["sources"][0]["transformateurs"][0]["chargeurs"] = list(
+            chargeurs.values()
+        )
 
     return merged
 
 
+def _coerce_dt(value: Any) -> datetime | None:
+    """Coerce one ISO string / Excel serial / datetime to a datetime."""
+    if isinstance(value, datetime):
+        return value
+    if value in (None, ""):
+        return None
+    try:
+        return datetime.fromisoformat(str(value))
+    except Exception:
+        pass
+    try:
+        return excel_number_to_datetime(float(value))
+    except Exception:
+        return None
+
+
+def _parse_time_column(values: List[Any]) -> List[datetime | None]:
+    """Parse a column of ISO strings / Excel serials to datetimes at once.
+
+    Mirrors the per-record ``_coerce_dt`` fallback chain but moves the
+    parsing into pandas so a whole batch is converted in one vectorised
+    pass.
+    """
+    series = pd.Series(values, dtype=object)
+    # format="ISO8601" keeps this aligned with the scalar chain, which only
+    # accepts ISO strings; the dateutil fallback would silently admit
+    # shapes like "01/02/2024" and guess at their meaning.
+    try:
+        parsed = pd.to_datetime(series, errors="coerce", format="ISO8601")
+    except ValueError:
+        # A column mixing naive and tz-aware strings makes to_datetime
+        # raise even with errors="coerce"; parse those per element so the
+        # batch path never rejects input the scalar path accepts.
+        return [_coerce_dt(v) for v in values]
+    nums = pd.to_numeric(series, errors="coerce")
+    # The serial conversion is built as its own series and the two are
+    # merged per element; assigning into ``parsed`` breaks when the ISO
+    # pass matches nothing and comes back at a coarser datetime unit.
+    # Rounded to microseconds, the resolution of the scalar conversion.
+    serial = (EXCEL_EPOCH + pd.to_timedelta(nums, unit="D")).dt.round("us")
+    return [
+        p.to_pydatetime()
+        if pd.notna(p)
+        else (s.to_pydatetime() if pd.notna(s) else None)
+        for p, s in zip(parsed, serial)
+    ]
+
+
+def _map_record_row(
+    record: Dict,
+    h_fin: datetime | None,
+    next_service: datetime | None,
+    /,
+    **kwargs: Any,
+) -> Dict:
+    """Map one record with its pre-parsed time values (pool-friendly shim)."""
+    return map_record(record, _hfin=h_fin, _next_service=next_service, **kwargs)
+
+
 def map_records(
     records: Iterable[Dict[str, Any]],
     *,
     template: Dict,
     aggregate: bool = False,
     infrastructure_path: Path | None = None,
+    parallel: bool = False,
+    max_workers: int | None = None,
     **kwargs: Any,
 ) -> Dict[str, Any]:
-    """Map multiple records to JSON structures."""
-    
+    """Map multiple records to JSON structures.
+
+    With ``parallel=True`` the records are mapped across a
+    :class:`~concurrent.futures.ProcessPoolExecutor`; each ``map_record``
+    call is independent, so the work splits cleanly.  The default stays
+    serial because process start-up only pays off for large batches.
+    """
+
+    records = list(records)
+
     infra = None
     if infrastructure_path is not None:
         try:
@@ -546,16 +781,80 @@ def map_records(
         except Exception:
             infra = None
 
-    results: List[Dict[str, Any]] = []
-    for rec in records:
-        results.append(
-            map_record(
-                rec,
-                template=template,
-                infrastructure_path=infrastructure_path,
-                **kwargs,
-            )
+    # Resolve the shared lookup tables once instead of once per record
+    battery_profile_path = kwargs.get("battery_profile_path", DEFAULT_BATTERY_PROFILE)
+    donnees_camions_path = kwargs.get(
+        "donnees_camions_path", DATA_DIR / "donnees_camions.xlsx"
+    )
+    resultat_simu_path = kwargs.get(
+        "resultat_simu_path", DATA_DIR / "resultat_simu_1.xlsx"
+    )
+    proj = int(kwargs.get("projection", 0))
+    profile = load_battery_profile(battery_profile_path)
+    shared = {
+        "_capacities": _for_projection(_load_donnees_camions(donnees_camions_path), proj),
+        "_powers": _for_projection(
+            _load_donnees_camions_puissance(donnees_camions_path), proj
+        ),
+        "_conso": _for_projection(_load_donnees_camions_conso(donnees_camions_path), proj),
+        "_profile": profile,
+        "_profile_max_y": max((p["y"] for p in profile), default=0) if profile else 0,
+        "_jour_bounds": jour_dep_bounds(resultat_simu_path),
+        "_infra": infra,
+        "_scaled_profiles": {},
+        "_marge_sec_hhmm": _to_hhmm(kwargs.get("marge_securite", 15)),
+        "_marge_pre_hhmm": _to_hhmm(kwargs.get("marge_prechauffage", 30)),
+    }
+    if infra is not None:
+        chargers = _flatten_chargeurs(infra)
+        shared["_chargers"] = chargers
+        shared["_prise_lists"] = [ch.get("prises", []) for ch in chargers]
+
+    # The optimisation window is identical for every record, so resolve the
+    # debut/fin ISO strings once instead of re-parsing them per record.
+    min_jour, max_jour = shared["_jour_bounds"]
+    start_dt = kwargs.get("start_dt")
+    end_dt = kwargs.get("end_dt")
+    if start_dt is not None:
+        shared["_debut_iso"] = _compute_debut_optim(start_dt, min_jour)
+    if end_dt is not None:
+        fin_iso = _compute_fin_optim(end_dt, max_jour)
+        shared["_fin_iso"] = fin_iso
+        shared["_default_debut_iso"] = (
+            parse_iso_datetime(fin_iso) + timedelta(days=1.5)
+        ).isoformat()
+
+    # Parse the per-record time columns in one vectorised pass instead of
+    # letting map_record run its scalar try/except chain per row.
+    if pd is not None and records:
+        hfin_vals = _parse_time_column([rec.get("hFin") for rec in records])
+        next_vals = _parse_time_column(
+            [rec.get("Heure Prochain Service") for rec in records]
         )
+    else:
+        hfin_vals = [None] * len(records)
+        next_vals = [None] * len(records)
+
+    worker = functools.partial(
+        _map_record_row,
+        template=template,
+        infrastructure_path=infrastructure_path,
+        **shared,
+        **kwargs,
+    )
+
+    if parallel:
+        n_workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(records) // (4 * n_workers))
+        with ProcessPoolExecutor(max_workers=max_workers) as ex:
+            results: List[Dict[str, Any]] = list(
+                ex.map(worker, records, hfin_vals, next_vals, chunksize=chunksize)
+            )
+    else:
+        results = [
+            worker(rec, hf, ns)
+            for rec, hf, ns in zip(records, hfin_vals, next_vals)
+        ]
 
     merged = aggregate_results(results)
     if infra is not None:
@@ -9,33 +9,89 @@ from typing import Any, Iterable, List, Dict
 
 import pandas as pd
 
+try:
+    import pyarrow.csv as pacsv
+except Exception:
+    pacsv = None
+
+
+def _lazy_frame(wb: Any, sheet_name: int | str) -> pd.DataFrame:
+    """Build a DataFrame from one sheet of an open read-only workbook."""
+    ws = wb[sheet_name] if isinstance(sheet_name, str) else wb.worksheets[sheet_name]
+    rows = ws.iter_rows(values_only=True)
+    header = next(rows, None)
+    if header is None:
+        return pd.DataFrame()
+    return pd.DataFrame(rows, columns=list(header))
+
+
+def _read_excel_lazy(path: Path, sheet_name: int | str) -> pd.DataFrame:
+    """Read one sheet through openpyxl in read-only mode.
+
+    The read-only workbook streams rows without materialising styles, which
+    keeps memory flat and skips most of the load time for lookup files.
+    """
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        return _lazy_frame(wb, sheet_name)
+    finally:
+        wb.close()
+
+
 def read_excel(
     path: str | Path,
     *,
     sheet_name: int | str | Iterable[int | str] = 0,
     as_dict: bool = False,
     add_sheet_column: bool = False,
+    lazy: bool = False,
     **kwargs: Any,
 ) -> pd.DataFrame | List[Dict[str, Any]]:
     """"
     Read one or several sheets from path and return either a pandas.DataFrame
     or a list of dictionnaries.
+
+    With ``lazy=True`` (and no pandas-specific kwargs) sheets are streamed
+    through openpyxl's read-only mode instead of a full workbook load.
     """
     path = Path(path)
+    use_lazy = lazy and not kwargs
 
     if isinstance(sheet_name, (list, tuple, set)):
+        # Open the workbook once and parse each sheet from it; calling
+        # pd.read_excel per sheet re-reads the whole zip every time.
         dfs = []
-        for sh in sheet_name:
-            df = pd.read_excel(path, sheet_name=sh, **kwargs)
-            if add_sheet_column:
-                df["__sheet__"] = sh
-            dfs.append(df)
+        if use_lazy:
+            from openpyxl import load_workbook
+
+            wb = load_workbook(path, read_only=True, data_only=True)
+            try:
+                for sh in sheet_name:
+                    df = _lazy_frame(wb, sh)
+                    if add_sheet_column:
+                        df["__sheet__"] = sh
+                    dfs.append(df)
+            finally:
+                wb.close()
+        else:
+            engine = kwargs.pop("engine", None)
+            with pd.ExcelFile(path, engine=engine) as xf:
+                for sh in sheet_name:
+                    df = xf.parse(sheet_name=sh, **kwargs)
+                    if add_sheet_column:
+                        df["__sheet__"] = sh
+                    dfs.append(df)
         df = pd.concat(dfs, ignore_index=True)
-    else: 
-        df = pd.read_excel(path, sheet_name=sheet_name, **kwargs)
+    else:
+        if use_lazy:
+            df = _read_excel_lazy(path, sheet_name)
+        else:
+            df = pd.read_excel(path, sheet_name=sheet_name, **kwargs)
         if add_sheet_column:
             df["__sheet__"] = sheet_name
-    
+
     return df.to_dict(orient="records") if as_dict else df
 
 def read_file(
@@ -64,7 +120,10 @@ def read_file(
             **kwargs,
         )
     if ext == ".csv":
-        df = pd.read_csv(path, **kwargs)
+        if pacsv is not None and not kwargs:
+            df = pacsv.read_csv(str(path)).to_pandas()
+        else:
+            df = pd.read_csv(path, **kwargs)
         return df.to_dict(orient="records") if as_dict else df
     
     raise ValueError(f"Unsupported file extension: {ext}")
\ No newline at end of file
@@ -4,10 +4,11 @@ from __future__ import annotations
 Utility helpers to clean and organise intervention data.
 """
 
-from typing import Mapping, Tuple
+from typing import Any, Mapping, Tuple
 
 from .utils import _load_donnees_camions
 
+import numpy as np
 import pandas as pd
 from pandas.api.types import is_datetime64_any_dtype
 
@@ -25,12 +26,26 @@ def add_next_service_time(
     """
     target = df if sort_inplace else df.copy()
     target.sort_values([vehicule_col, start_col], inplace=True)
-    #Shift by one line for each group
-    target[new_col] = (
-        target
-        .groupby(vehicule_col, sort=False)[start_col]
-        .shift(-1)
-    )
+
+    # Shift by one line within each vehicle group.  The frame is already
+    # sorted, so a plain numpy shift plus a mask on the group boundaries
+    # avoids the per-group dispatch of groupby().shift(-1).
+    veh = target[vehicule_col].to_numpy()
+    times = target[start_col].to_numpy()
+    if times.dtype.kind in "Mm":
+        fill: Any = np.datetime64("NaT")
+    elif times.dtype.kind == "f":
+        fill = np.nan
+    else:
+        times = times.astype(object)
+        fill = None
+    next_t = np.empty_like(times)
+    if len(times):
+        next_t[:-1] = times[1:]
+        next_t[-1] = fill
+        # The last row of each vehicle has no following service.
+        next_t[:-1][veh[:-1] != veh[1:]] = fill
+    target[new_col] = next_t
     return target
 
 def compute_soc(
@@ -57,24 +72,30 @@ def compute_soc(
     The result for one service does not affect the following ones.s
     """
     target = df.sort_values([vehicule_col, start_col]).copy()
-    target[soc_col] = None
 
     if capacity_table is None:
         capacity_table = _load_donnees_camions()
 
- 
-    for idx, row in target.iterrows():
-        modele = str(row[model_col]).strip()
-        conso = conso_table.get((projection, modele), 0.0)
-        capacite = capacity_table.get((projection, modele), 0.0)
-        try:
-            dist = float(row[distance_col])
-        except Exception:
-            dist = 0.0
-        if capacite:
-            delta_soc = (conso * dist) / capacite * 100
-        else:
-            delta_soc = 0.0
-        target.at[idx, soc_col] = max(soc_cible - delta_soc, 0)
+    # Pre-index the lookup tables for the fixed projection so the per-row
+    # lookups hash only the model string, not a (projection, modele) tuple.
+    conso_proj = {m: v for (p, m), v in conso_table.items() if p == projection}
+    cap_proj = {m: v for (p, m), v in capacity_table.items() if p == projection}
+
+    # Whole-column arrays instead of an iterrows/.at loop
+    modeles = target[model_col].astype(str).str.strip()
+    conso_arr = np.array(
+        [conso_proj.get(m, 0.0) for m in modeles], dtype=np.float64
+    )
+    cap_arr = np.array(
+        [cap_proj.get(m, 0.0) for m in modeles], dtype=np.float64
+    )
+    dist = pd.to_numeric(target[distance_col], errors="coerce").fillna(0.0).to_numpy(
+        dtype=np.float64
+    )
+    delta_soc = (
+        np.divide(conso_arr * dist, cap_arr, out=np.zeros_like(dist), where=cap_arr != 0)
+        * 100.0
+    )
+    target[soc_col] = np.maximum(soc_cible - delta_soc, 0)
 
     return target
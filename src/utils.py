@@ -1,75 +1,263 @@
 from pathlib import Path
 from typing import Dict, Iterable, List, Tuple, Any
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta
+import functools
 import json
+import sys
 import zipfile
 import xml.etree.ElementTree as ET
 
+# lxml's libxml2-backed iterparse with a tag filter keeps the per-element
+# loop out of the interpreter; the stdlib parser is the fallback.
+try:
+    from lxml import etree as _lxml_etree
+except Exception:
+    _lxml_etree = None
+
 DATA_DIR = Path(__file__).resolve().parents[1] / "data"
 DEFAULT_BATTERY_PROFILE = DATA_DIR / "profil_batterie_camion.xlsx"
 DEFAULT_DONNEES_CAMIONS = DATA_DIR / "donnees_camions.xlsx"
 
+# pandas and yaml are imported on first use rather than at module import:
+# importing pandas costs hundreds of milliseconds, which dominates startup
+# for code paths that never touch a DataFrame.
+_UNRESOLVED = object()
+_pandas: Any = _UNRESOLVED
+_yaml: Any = _UNRESOLVED
+
+
+def _get_pandas():
+    """Return the pandas module, or ``None`` when it is not installed."""
+    global _pandas
+    if _pandas is _UNRESOLVED:
+        try:
+            import pandas
+        except Exception:
+            _pandas = None
+        else:
+            _pandas = pandas
+    return _pandas
+
+
+def _get_yaml():
+    """Return the yaml module, or ``None`` when it is not installed."""
+    global _yaml
+    if _yaml is _UNRESOLVED:
+        try:
+            import yaml
+        except Exception:
+            _yaml = None
+        else:
+            _yaml = yaml
+    return _yaml
+
+# Prefer the Rust-based calamine engine for pd.read_excel when installed;
+# otherwise stream with openpyxl in read-only mode.
+try:
+    import python_calamine
+except Exception:
+    python_calamine = None
+
+if python_calamine is not None:
+    _EXCEL_ENGINE_KWARGS: Dict[str, Any] = {"engine": "calamine"}
+else:
+    _EXCEL_ENGINE_KWARGS = {
+        "engine": "openpyxl",
+        "engine_kwargs": {"read_only": True, "data_only": True},
+    }
+
 try:
-    import pandas as pd
-except Exception:  
-    pd = None
-    
-try:  
-    import yaml
+    import orjson
 except Exception:
-    yaml = None
+    orjson = None
+
+
+_XLSX_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_TAG_C = _XLSX_NS + "c"
+_TAG_V = _XLSX_NS + "v"
+_TAG_T = _XLSX_NS + "t"
+
+
+def _iterparse_tag(source, tag: str):
+    """Yield each element with ``tag`` from a streaming parse of ``source``.
+
+    Elements are cleared (and, with lxml, their already-seen siblings
+    dropped) after the caller has consumed them.
+    """
+    if _lxml_etree is not None:
+        for _event, elem in _lxml_etree.iterparse(source, tag=tag):
+            yield elem
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    else:
+        for _event, elem in ET.iterparse(source, events=("end",)):
+            if elem.tag == tag:
+                yield elem
+                elem.clear()
+
+
+def _load_shared_strings(z: zipfile.ZipFile) -> List[str]:
+    """Stream ``sharedStrings.xml`` and return the shared string table.
+
+    ``iterparse`` over the open zip entry consumes the deflate stream
+    incrementally and releases each ``<si>`` after use, instead of
+    materialising the whole document tree.
+    """
+    strings: List[str] = []
+    try:
+        info = z.getinfo("xl/sharedStrings.xml")
+    except KeyError:
+        # Workbooks written with inline strings have no shared string table.
+        return strings
+    with z.open(info) as source:
+        for elem in _iterparse_tag(source, _XLSX_NS + "si"):
+            # Shared strings repeat heavily (model names, modes, charger
+            # types); interning them makes later dict lookups and equality
+            # tests on those values pointer comparisons.
+            strings.append(
+                sys.intern("".join(t.text or "" for t in elem.iter(_XLSX_NS + "t")))
+            )
+    return strings
+
+
+def _iter_sheet_rows(
+    z: zipfile.ZipFile,
+    strings: List[str],
+    sheet: str = "xl/worksheets/sheet1.xml",
+) -> Iterable[List[str]]:
+    """Stream a worksheet and yield each row as a list of cell values.
+
+    Rows are produced on the fly and cleared once yielded, so peak memory
+    stays at one ``<row>`` element instead of the whole sheet DOM.
+    """
+    with z.open(sheet) as source:
+        # The cell loop is the hottest code of the fallback parser: tag
+        # names are precomputed module constants and the type attribute is
+        # fetched once per cell instead of once per branch.
+        for elem in _iterparse_tag(source, _XLSX_NS + "row"):
+            vals: List[str] = []
+            append = vals.append
+            for c in elem:
+                if c.tag != _TAG_C:
+                    continue
+                t = c.get("t")
+                v = c.find(_TAG_V)
+                if v is None:
+                    if t == "inlineStr":
+                        append("".join(x.text or "" for x in c.iter(_TAG_T)))
+                    else:
+                        append("")
+                elif t == "s":
+                    append(strings[int(v.text)])
+                else:
+                    append(v.text)
+            yield vals
+
+
+def _iter_xlsx_rows(path: Path | str) -> Iterable[List[str]]:
+    """Yield each row of the first worksheet of ``path`` as cell values.
+
+    Shared strings are already substituted, so loaders only project the
+    columns they need; the zip stays open for the duration of the iteration.
+    With python-calamine installed the whole zip+XML dance is replaced by
+    its Rust parser, which yields typed cell values instead of raw strings;
+    the loaders coerce either form identically.
+    """
+    if python_calamine is not None:
+        workbook = python_calamine.CalamineWorkbook.from_path(str(path))
+        yield from workbook.get_sheet_by_index(0).to_python()
+        return
+    with zipfile.ZipFile(Path(path)) as z:
+        strings = _load_shared_strings(z)
+        yield from _iter_sheet_rows(z, strings)
+
+
+# Distinct (path, kwargs) combinations kept per decorated loader.
+_EXCEL_CACHE_MAX = 4
+
+
+def _excel_cached(func):
+    """Memoize an Excel loader on ``(path, mtime)`` and its keyword arguments.
+
+    Repeated conversions from the GUI re-read the same files; the parsed
+    result is reused as long as the file on disk has not changed.  The
+    cache key is ``(path, kwargs)`` with the mtime stored alongside the
+    value, so editing and reconverting a file replaces its entry instead
+    of retaining the stale parse, and the cache is bounded LRU-style at
+    ``_EXCEL_CACHE_MAX`` entries per loader.  Cached values are shared, so
+    callers must treat them as read-only.
+    """
+    cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any):
+        if args:
+            path = Path(args[0])
+        elif "path" in kwargs:
+            path = Path(kwargs["path"])
+        else:
+            path = Path(func.__defaults__[0])
+        key = (str(path.resolve()), tuple(sorted(kwargs.items())))
+        mtime = path.stat().st_mtime_ns
+        hit = cache.get(key)
+        if hit is not None and hit[0] == mtime:
+            cache.move_to_end(key)
+            return hit[1]
+        value = func(*args, **kwargs)
+        cache[key] = (mtime, value)
+        cache.move_to_end(key)
+        if len(cache) > _EXCEL_CACHE_MAX:
+            cache.popitem(last=False)
+        return value
+
+    return wrapper
 
 
 def load_infrastructure(path: Path | str) -> Dict[str, Any]:
     """Load infrastructure description from JSON or YAML file."""
     path = Path(path)
-    text = path.read_text(encoding="utf-8")
     ext = path.suffix.lower()
     if ext in {".yaml", ".yml"}:
+        yaml = _get_yaml()
         if yaml is None:
             raise ImportError("PyYAML is required to load YAML files")
-        return yaml.safe_load(text) or {}
-    return json.loads(text)
+        return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
 
+@_excel_cached
 def load_battery_profile(path: Path = DEFAULT_BATTERY_PROFILE) -> List[Dict[str, float]]:
     """Return the battery profile as a list of ``{"x": float, "y": float}``."""
+    pd = _get_pandas()
     if pd is not None:
-        df = pd.read_excel(path)
-        rows = df.to_numpy().tolist()
-    else:
-        with zipfile.ZipFile(path) as z:
-            ns = {"m": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
-            strings_root = ET.fromstring(z.read("xl/sharedStrings.xml"))
-            strings = [
-                "".join(t.text or "" for t in si.findall(".//m:t", ns))
-                for si in strings_root.findall("m:si", ns)
-            ]
-            sheet = ET.fromstring(z.read("xl/worksheets/sheet1.xml"))
-            rows = []
-            for row in sheet.findall("m:sheetData/m:row", ns):
-                vals = []
-                for c in row.findall("m:c", ns):
-                    v = c.find("m:v", ns)
-                    if v is None:
-                        vals.append("")
-                    elif c.get("t") == "s":
-                        vals.append(strings[int(v.text)])
-                    else:
-                        vals.append(v.text)
-                rows.append(vals)
-            rows = rows[1:]
+        # Coerce and filter the two columns as whole arrays; the scalar
+        # NaN/empty checks and int casts then happen in C instead of a
+        # per-row Python loop.
+        df = pd.read_excel(path, **_EXCEL_ENGINE_KWARGS)
+        if df.shape[1] < 2:
+            return []
+        xs = pd.to_numeric(df.iloc[:, 0], errors="coerce")
+        ys = pd.to_numeric(df.iloc[:, 1], errors="coerce")
+        mask = xs.notna() & ys.notna()
+        return [
+            {"x": x, "y": y}
+            for x, y in zip(
+                xs[mask].astype(int).tolist(), ys[mask].astype(int).tolist()
+            )
+        ]
+
+    with zipfile.ZipFile(path) as z:
+        strings = _load_shared_strings(z)
+        rows = list(_iter_sheet_rows(z, strings))[1:]
     result = []
     for r in rows:
         if len(r) < 2:
             continue
         x, y = r[0], r[1]
-        if pd is not None:
-            try:
-                import math
-                if x is None or y is None or (isinstance(x, float) and math.isnan(x)) or (isinstance(y, float) and math.isnan(y)):
-                    continue
-            except Exception:
-                pass
         if x in ("", None) or y in ("", None):
             continue
         try:
@@ -79,41 +267,62 @@ def load_battery_profile(path: Path = DEFAULT_BATTERY_PROFILE) -> List[Dict[str,
     return result
 
 
+@_excel_cached
+def _read_donnees_camions_sheet(
+    path: Path = DEFAULT_DONNEES_CAMIONS,
+) -> Tuple[List[str], List[List[str]]]:
+    """Parse the donnees_camions workbook once as ``(header, rows)``.
+
+    The capacity, consumption and power loaders all target the same sheet;
+    sharing one cached parse means one unzip and one XML pass instead of
+    three.
+    """
+    rows = _iter_xlsx_rows(Path(path))
+    header = next(rows)
+    return header, list(rows)
+
+
+@_excel_cached
+def _read_donnees_camions_df(path: Path = DEFAULT_DONNEES_CAMIONS):
+    """Read the donnees_camions workbook once as a DataFrame (cached)."""
+    pd = _get_pandas()
+    return pd.read_excel(path, **_EXCEL_ENGINE_KWARGS)
+
+
+def _donnees_camions_pd(path: Path, value_col: str) -> Dict[Tuple[int, str], float]:
+    """Read one ``(projection, modele) -> value`` table through pandas.
+
+    The engine behind ``pd.read_excel`` (calamine or read-only openpyxl)
+    parses the sheet in compiled code, which beats the hand-rolled XML walk
+    whenever pandas is importable; rows with unusable values are dropped
+    like the XML fallback does.  The underlying frame is shared by the
+    three table loaders through the cached reader.
+    """
+    pd = _get_pandas()
+    df = _read_donnees_camions_df(path)
+    proj = pd.to_numeric(df["Projection"], errors="coerce")
+    vals = pd.to_numeric(df[value_col], errors="coerce")
+    modeles = df["Modèle"].astype(str).str.strip()
+    mask = proj.notna() & vals.notna() & (modeles != "")
+    return {
+        (int(p), m): float(v)
+        for p, m, v in zip(proj[mask], modeles[mask], vals[mask])
+    }
+
+
+@_excel_cached
 def _load_donnees_camions(path: Path = DEFAULT_DONNEES_CAMIONS) -> Dict[Tuple[int, str], float]:
     """Return a mapping ``(projection, modele) -> capacite`` from the Excel file."""
     path = Path(path)
+    if _get_pandas() is not None:
+        return _donnees_camions_pd(path, "Capacité max de la batterie (kWh)")
     mapping: Dict[Tuple[int, str], float] = {}
-    with zipfile.ZipFile(path) as z:
-        strings_xml = z.read("xl/sharedStrings.xml")
-        root = ET.fromstring(strings_xml)
-        strings = [
-            "".join(t.text or "" for t in si.findall(".//{http://schemas.openxmlformats.org/spreadsheetml/2006/main}t"))
-            for si in root.findall("{http://schemas.openxmlformats.org/spreadsheetml/2006/main}si")
-        ]
-
-        sheet_xml = z.read("xl/worksheets/sheet1.xml")
-        sheet = ET.fromstring(sheet_xml)
-
-        rows = []
-        ns = {"m": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
-        for row in sheet.findall("m:sheetData/m:row", ns):
-            vals = []
-            for c in row.findall("m:c", ns):
-                v = c.find("m:v", ns)
-                if v is None:
-                    vals.append("")
-                elif c.get("t") == "s":
-                    vals.append(strings[int(v.text)])
-                else:
-                    vals.append(v.text)
-            rows.append(vals)
-
-    header = rows[0]
+    header, rows = _read_donnees_camions_sheet(path)
     proj_idx = header.index("Projection")
     model_idx = header.index("Modèle")
     cap_idx = header.index("Capacité max de la batterie (kWh)")
 
-    for r in rows[1:]:
+    for r in rows:
         if len(r) <= cap_idx:
             continue
         try:
@@ -131,43 +340,21 @@ def _load_donnees_camions(path: Path = DEFAULT_DONNEES_CAMIONS) -> Dict[Tuple[in
 
     return mapping
 
+@_excel_cached
 def _load_donnees_camions_conso(
     path: Path = DEFAULT_DONNEES_CAMIONS,
 ) -> Dict[Tuple[int, str], float]:
     """Return a mapping ``(projection, modele) -> consumption`` from the Excel file."""
     path = Path(path)
+    if _get_pandas() is not None:
+        return _donnees_camions_pd(path, "Conso estimée réelle (kWh/km)")
     mapping: Dict[Tuple[int, str], float] = {}
-    with zipfile.ZipFile(path) as z:
-        strings_xml = z.read("xl/sharedStrings.xml")
-        root = ET.fromstring(strings_xml)
-        strings = [
-            "".join(t.text or "" for t in si.findall(".//{http://schemas.openxmlformats.org/spreadsheetml/2006/main}t"))
-            for si in root.findall("{http://schemas.openxmlformats.org/spreadsheetml/2006/main}si")
-        ]
-
-        sheet_xml = z.read("xl/worksheets/sheet1.xml")
-        sheet = ET.fromstring(sheet_xml)
-
-        rows = []
-        ns = {"m": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
-        for row in sheet.findall("m:sheetData/m:row", ns):
-            vals = []
-            for c in row.findall("m:c", ns):
-                v = c.find("m:v", ns)
-                if v is None:
-                    vals.append("")
-                elif c.get("t") == "s":
-                    vals.append(strings[int(v.text)])
-                else:
-                    vals.append(v.text)
-            rows.append(vals)
-
-    header = rows[0]
+    header, rows = _read_donnees_camions_sheet(path)
     proj_idx = header.index("Projection")
     model_idx = header.index("Modèle")
     conso_idx = header.index("Conso estimée réelle (kWh/km)")
 
-    for r in rows[1:]:
+    for r in rows:
         if len(r) <= conso_idx:
             continue
         try:
@@ -188,57 +375,126 @@ def _load_donnees_camions_conso(
 DEFAULT_RESULTAT_SIMU = DATA_DIR / "resultat_simu_1.xlsx"
 
 
-def load_resultat_simu(
+@dataclass(slots=True)
+class SimuRecord:
+    """One resultat-simu row with slot storage instead of a per-row dict.
+
+    The known columns live in ``__slots__`` (attribute access is an offset
+    load, and each record skips the dict hash table); columns not listed
+    here land in ``_extra``.  ``__getitem__``/``get`` keep the historical
+    dict-style access working for existing callers.
+    """
+
+    mode: str = ""
+    jourDep: str = ""
+    newIdVeh: str = ""
+    tVeh: str = ""
+    hDep: str = ""
+    hFin: str = ""
+    dist: str = ""
+    seqVoy: str = ""
+    soc: str = ""
+    soc_retour: str = ""
+    socCible: str = ""
+    _extra: Dict[str, Any] = field(default_factory=dict)
+    # Slot columns that actually existed in the file header; slot fields
+    # outside this set behave as absent keys so the dict contract holds.
+    _present: frozenset = frozenset()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._present:
+            return getattr(self, key)
+        return self._extra[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._present:
+            return getattr(self, key)
+        return self._extra.get(key, default)
+
+
+_SIMU_FIELDS = frozenset(
+    f.name for f in fields(SimuRecord) if f.name not in ("_extra", "_present")
+)
+
+
+def iter_resultat_simu(
     path: Path = DEFAULT_RESULTAT_SIMU, *, mode: str | None = "E"
-) -> List[Dict[str, str]]:
+) -> Iterable[SimuRecord]:
     """
-    Return the rows of the Excel file filtered by vehicle mode : 'E' or 'T'. 
+    Yield the rows of the Excel file filtered by vehicle mode : 'E' or 'T'.
+
+    Records are produced one at a time, so consumers that process and
+    discard each row never hold more than one record in memory.
     """
     path = Path(path)
-    records: List[Dict[str, str]] = []
-    with zipfile.ZipFile(path) as z:
-        strings_xml = z.read("xl/sharedStrings.xml")
-        root = ET.fromstring(strings_xml)
-        strings = [
-            "".join(t.text or "" for t in si.findall(
-                ".//{http://schemas.openxmlformats.org/spreadsheetml/2006/main}t"
-            ))
-            for si in root.findall(
-                "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}si"
-            )
-        ]
-
-        sheet_xml = z.read("xl/worksheets/sheet1.xml")
-        sheet = ET.fromstring(sheet_xml)
+    rows = _iter_xlsx_rows(path)
 
-        rows = []
-        ns = {"m": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
-        for row in sheet.findall("m:sheetData/m:row", ns):
-            vals = []
-            for c in row.findall("m:c", ns):
-                v = c.find("m:v", ns)
-                if v is None:
-                    vals.append("")
-                elif c.get("t") == "s":
-                    vals.append(strings[int(v.text)])
-                else:
-                    vals.append(v.text)
-            rows.append(vals)
-
-    header = rows[0]
+    header = next(rows)
     mode_idx = header.index("mode")
+    h_len = len(header)
 
-    for r in rows[1:]:
+    # The header is partitioned into slot columns and extra columns once,
+    # so the per-row work is two index-driven comprehensions.
+    known_idx = [(i, h) for i, h in enumerate(header) if h in _SIMU_FIELDS]
+    extra_idx = [(i, h) for i, h in enumerate(header) if h not in _SIMU_FIELDS]
+    present = frozenset(h for _, h in known_idx)
+
+    # Filter by mode before building the record so rejected rows allocate
+    # nothing.
+    for r in rows:
         if len(r) <= mode_idx:
             continue
         if mode is not None and str(r[mode_idx]).strip() != mode:
             continue
-        record = {
-            header[i]: (r[i] if i < len(r) else "") for i in range(len(header))
-        }
-        records.append(record)
+        if len(r) < h_len:
+            r = r + [""] * (h_len - len(r))
+        yield SimuRecord(
+            _extra={h: r[i] for i, h in extra_idx},
+            _present=present,
+            **{h: r[i] for i, h in known_idx},
+        )
+
+
+@_excel_cached
+def load_resultat_simu(
+    path: Path = DEFAULT_RESULTAT_SIMU, *, mode: str | None = "E"
+) -> List[SimuRecord]:
+    """
+    Return the rows of the Excel file filtered by vehicle mode : 'E' or 'T'.
+    """
+    return list(iter_resultat_simu(Path(path), mode=mode))
+
+
+# Known numeric columns of resultat_simu; everything else stays a string so
+# the records match :func:`load_resultat_simu`.
+RECORD_DTYPES: Dict[str, str] = {
+    "jourDep": "float64",
+    "dist": "float64",
+}
+
+
+@_excel_cached
+def load_resultat_simu_df(
+    path: Path = DEFAULT_RESULTAT_SIMU, *, mode: str | None = "E"
+):
+    """
+    Return the rows of the Excel file as a :class:`pandas.DataFrame` filtered
+    by vehicle mode : 'E' or 'T'.
+    """
+    pd = _get_pandas()
+    if pd is None:
+        raise ImportError("pandas is required to load resultat_simu as a DataFrame")
+    df = pd.read_excel(path, dtype=str, **_EXCEL_ENGINE_KWARGS)
+    if mode is not None:
+        df = df[df["mode"].astype(str).str.strip() == mode]
+    df = df.reset_index(drop=True)
+    # Fix the dtypes of the known numeric columns up front instead of letting
+    # every consumer re-coerce them.
+    for col, dtype in RECORD_DTYPES.items():
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype(dtype)
+    return df
 
-    return records
 
 EXCEL_EPOCH = datetime(1899, 12, 30)
 
@@ -248,62 +504,63 @@ def excel_number_to_datetime(value: float) -> datetime:
     return EXCEL_EPOCH + timedelta(days=float(value))
 
 
+def datetime_to_excel_number(dt: datetime) -> float:
+    """Convert a :class:`datetime` to an Excel serial date number."""
+    return (dt - EXCEL_EPOCH) / timedelta(days=1)
+
+
+@_excel_cached
 def jour_dep_bounds(
     path: Path = DEFAULT_RESULTAT_SIMU,
     *,
     mode: str | None = None,
 ) -> tuple[datetime, datetime]:
     """Return the minimum and maximum ``jourDep`` values as datetimes."""
-    rows = load_resultat_simu(path, mode=mode)
-    jour_vals: List[float] = []
-    for r in rows:
+    pd = _get_pandas()
+    if pd is not None:
+        # Read just the two needed columns and reduce with the vectorised
+        # min/max instead of materialising one dict per row.
+        df = pd.read_excel(path, usecols=["jourDep", "mode"], **_EXCEL_ENGINE_KWARGS)
+        if mode is not None:
+            df = df[df["mode"].astype(str).str.strip() == mode]
+        jours = pd.to_numeric(df["jourDep"], errors="coerce").dropna()
+        if jours.empty:
+            return EXCEL_EPOCH, EXCEL_EPOCH
+        return (
+            excel_number_to_datetime(float(jours.min())),
+            excel_number_to_datetime(float(jours.max())),
+        )
+
+    lo: float | None = None
+    hi: float | None = None
+    for r in iter_resultat_simu(path, mode=mode):
         try:
-            jour_vals.append(float(r.get("jourDep", 0)))
+            val = float(r.get("jourDep", 0))
         except Exception:
             continue
-    if not jour_vals:
+        if lo is None or val < lo:
+            lo = val
+        if hi is None or val > hi:
+            hi = val
+    if lo is None or hi is None:
         return EXCEL_EPOCH, EXCEL_EPOCH
-    return excel_number_to_datetime(min(jour_vals)), excel_number_to_datetime(
-        max(jour_vals)
-    )
+    return excel_number_to_datetime(lo), excel_number_to_datetime(hi)
 
+@_excel_cached
 def _load_donnees_camions_puissance(
     path: Path = DEFAULT_DONNEES_CAMIONS,
 ) -> Dict[Tuple[int, str], float]:
     """Return a mapping ``(projection, modele) -> puissance`` from the Excel file."""
     path = Path(path)
+    if _get_pandas() is not None:
+        return _donnees_camions_pd(path, "Puissance de recharge max (kW)")
     mapping: Dict[Tuple[int, str], float] = {}
-    with zipfile.ZipFile(path) as z:
-        strings_xml = z.read("xl/sharedStrings.xml")
-        root = ET.fromstring(strings_xml)
-        strings = [
-            "".join(t.text or "" for t in si.findall(".//{http://schemas.openxmlformats.org/spreadsheetml/2006/main}t"))
-            for si in root.findall("{http://schemas.openxmlformats.org/spreadsheetml/2006/main}si")
-        ]
-
-        sheet_xml = z.read("xl/worksheets/sheet1.xml")
-        sheet = ET.fromstring(sheet_xml)
-
-        rows = []
-        ns = {"m": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
-        for row in sheet.findall("m:sheetData/m:row", ns):
-            vals = []
-            for c in row.findall("m:c", ns):
-                v = c.find("m:v", ns)
-                if v is None:
-                    vals.append("")
-                elif c.get("t") == "s":
-                    vals.append(strings[int(v.text)])
-                else:
-                    vals.append(v.text)
-            rows.append(vals)
-
-    header = rows[0]
+    header, rows = _read_donnees_camions_sheet(path)
     proj_idx = header.index("Projection")
     model_idx = header.index("Modèle")
     power_idx = header.index("Puissance de recharge max (kW)")
 
-    for r in rows[1:]:
+    for r in rows:
         if len(r) <= power_idx:
             continue
         try:
@@ -326,7 +583,18 @@ def parse_iso_datetime(value: str | datetime) -> datetime:
 
     if isinstance(value, datetime):
         return value
-    return datetime.fromisoformat(str(value).rstrip("Z"))
+    return _parse_iso_datetime_cached(str(value))
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_iso_datetime_cached(value: str) -> datetime:
+    # A single endswith/slice beats rstrip, which allocates a new string
+    # even when there is no trailing Z.  The suffix is stripped rather than
+    # handed to fromisoformat (3.11+ parses it natively) so the result
+    # stays naive and comparable with the naive jourDep datetimes.
+    if value.endswith("Z"):
+        value = value[:-1]
+    return datetime.fromisoformat(value)
 
 
 def isoformat_z(dt: datetime, *, timespec: str = "seconds") -> str:
@@ -163,36 +163,72 @@ SCHEMA: Dict[str, Any] = {
 
 # Validation engine -------------------------------------------------------
 
-def _validate(value: Any, schema: Any, path: str = "") -> None:
-    """Recursively validate value against schema."""
+def _fmt_path(path: tuple) -> str:
+    """Format a path tuple for an error message; only called on failure."""
+    return (
+        ".".join(f"[{p}]" if isinstance(p, int) else p for p in path) or "value"
+    )
+
+
+def _compile(schema: Any) -> Callable[[Any, tuple], None]:
+    """Build a specialized checker function for ``schema``.
+
+    The schema is walked once and each node becomes a closure with its
+    sub-checkers, keys and types pre-bound, so validating a document no
+    longer dispatches on the schema shape per node.  Paths are threaded as
+    tuples and only joined into a string when an error is raised, so the
+    successful path allocates no strings at all.
+    """
     if isinstance(schema, dict):
-        if not isinstance(value, dict):
-            raise TypeError(f"{path or 'value'} must be an object")
-        for key, subschema in schema.items():
-            if key not in value:
-                raise ValueError(f"Missing key {path + key}")
-            _validate(value[key], subschema, path + key + ".")
-    elif isinstance(schema, list):
-        if not isinstance(value, list):
-            raise TypeError(f"{path.rstrip('.') or 'value'} must be a list")
+        items = [(key, _compile(sub)) for key, sub in schema.items()]
+
+        def check(value: Any, path: tuple = ()) -> None:
+            if not isinstance(value, dict):
+                raise TypeError(f"{_fmt_path(path)} must be an object")
+            for key, sub_check in items:
+                if key not in value:
+                    raise ValueError(f"Missing key {_fmt_path(path + (key,))}")
+                sub_check(value[key], path + (key,))
+
+        return check
+    if isinstance(schema, list):
         if len(schema) != 1:
             raise ValueError("schema list must contain a single element")
-        subschema = schema[0]
-        for idx, item in enumerate(value):
-            _validate(item, subschema, f"{path}[{idx}].")
-    elif isinstance(schema, type):
-        if not isinstance(value, schema):
-            raise TypeError(f"{path.rstrip('.')} must be of type {schema.__name__}")
-    elif isinstance(schema, tuple):
-        if not any(isinstance(value, t) for t in schema):
-            raise TypeError(f"{path.rstrip('.')} must be of type {schema}")
-    elif callable(schema):
-        if not schema(value):
-            raise ValueError(f"{path.rstrip('.')} has invalid value")
-    else:
-        raise TypeError("Unsupported schema element")
+        sub_check = _compile(schema[0])
+
+        def check(value: Any, path: tuple = ()) -> None:
+            if not isinstance(value, list):
+                raise TypeError(f"{_fmt_path(path)} must be a list")
+            for idx, item in enumerate(value):
+                sub_check(item, path + (idx,))
+
+        return check
+    if isinstance(schema, (type, tuple)):
+        name = schema.__name__ if isinstance(schema, type) else schema
+
+        def check(value: Any, path: tuple = ()) -> None:
+            if not isinstance(value, schema):
+                raise TypeError(f"{_fmt_path(path)} must be of type {name}")
+
+        return check
+    if callable(schema):
+
+        def check(value: Any, path: tuple = ()) -> None:
+            if not schema(value):
+                raise ValueError(f"{_fmt_path(path)} has invalid value")
+
+        return check
+    raise TypeError("Unsupported schema element")
+
+
+def _validate(value: Any, schema: Any, path: tuple = ()) -> None:
+    """Recursively validate value against schema."""
+    _compile(schema)(value, path)
+
+
+_validate_compiled = _compile(SCHEMA)
 
 
 def validate_json(data: Dict[str, Any]) -> None:
     """Validate data against the built-in JSON schema."""
-    _validate(data, SCHEMA, path="")
\ No newline at end of file
+    _validate_compiled(data, ())
\ No newline at end of file
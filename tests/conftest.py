@@ -0,0 +1,22 @@
+"""Shared pytest configuration.
+
+Puts the repository root on ``sys.path`` once so every test module can
+import ``src.*`` without repeating the path insert.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+@pytest.fixture(scope="session")
+def shared_tmp(tmp_path_factory):
+    """One session-wide directory for artifacts that need no isolation.
+
+    Fixtures that only write a file once and read it back share this
+    directory instead of asking pytest for a fresh numbered tmp dir each.
+    """
+    return tmp_path_factory.mktemp("x2j", numbered=False)
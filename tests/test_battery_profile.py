@@ -1,8 +1,5 @@
-import os
-import sys
 from pathlib import Path
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from src.mapper import load_battery_profile, map_record, _load_template, DEFAULT_BATTERY_PROFILE
 
@@ -1,10 +1,7 @@
-import os
-import sys
 import json
 from pathlib import Path
 import pytest
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 pd = pytest.importorskip("pandas")
 
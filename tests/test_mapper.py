@@ -1,10 +1,7 @@
-import os
-import sys
 from pathlib import Path
 import json
 import pytest
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from src.mapper import map_record, map_records, _load_template, build_chargeurs
 from src.utils import (
@@ -2,75 +2,88 @@
 
 from __future__ import annotations
 
-import os
-import sys
-from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 pd = pytest.importorskip("pandas")
 
+from openpyxl import Workbook
+
 from src.reader import read_excel, read_file
 
 
-def _create_excel(tmp_path: Path):
+# The tests below only read the files, so one workbook/csv written per
+# session is enough; per-test Excel writes dominate this module's runtime.
+@pytest.fixture(scope="session")
+def excel_workbook(shared_tmp):
     df1 = pd.DataFrame({"A": [1, 2], "B": ["a", "b"]})
     df2 = pd.DataFrame({"A": [3, 4], "B": ["c", "d"]})
-    file_path = tmp_path / "test.xlsx"
-    with pd.ExcelWriter(file_path) as writer:
-        df1.to_excel(writer, index=False, sheet_name="Sheet1")
-        df2.to_excel(writer, index=False, sheet_name="Sheet2")
+    file_path = shared_tmp / "test.xlsx"
+    # Append the rows through openpyxl directly; pandas' Excel serializer
+    # is pure overhead for these two-row frames.
+    wb = Workbook()
+    wb.remove(wb.active)
+    for name, df in (("Sheet1", df1), ("Sheet2", df2)):
+        ws = wb.create_sheet(name)
+        ws.append(list(df.columns))
+        for row in df.itertuples(index=False):
+            ws.append(list(row))
+    wb.save(file_path)
     return file_path, df1, df2
 
 
-def _create_csv(tmp_path: Path):
+@pytest.fixture(scope="session")
+def csv_file(shared_tmp):
     df = pd.DataFrame({"A": [1, 2], "B": ["a", "b"]})
-    file_path = tmp_path / "test.csv"
+    file_path = shared_tmp / "test.csv"
     df.to_csv(file_path, index=False)
     return file_path, df
 
 
-def test_read_excel_single_sheet_df(tmp_path):
-    excel_file, df1, _ = _create_excel(tmp_path)
+def test_read_excel_single_sheet_df(excel_workbook):
+    excel_file, df1, _ = excel_workbook
     result = read_excel(excel_file, sheet_name="Sheet1")
-    pd.testing.assert_frame_equal(result.reset_index(drop=True), df1)
+    pd.testing.assert_frame_equal(
+        result.reset_index(drop=True), df1, check_exact=True, check_dtype=False
+    )
 
 
-def test_read_excel_multi_sheet_add_sheet_column(tmp_path):
-    excel_file, df1, df2 = _create_excel(tmp_path)
+def test_read_excel_multi_sheet_add_sheet_column(excel_workbook):
+    excel_file, _, _ = excel_workbook
     result = read_excel(
         excel_file,
         sheet_name=["Sheet1", "Sheet2"],
         add_sheet_column=True,
     )
-    expected = pd.concat(
-        [
-            df1.assign(__sheet__="Sheet1"),
-            df2.assign(__sheet__="Sheet2"),
-        ],
-        ignore_index=True,
+    expected = pd.DataFrame(
+        {
+            "A": [1, 2, 3, 4],
+            "B": ["a", "b", "c", "d"],
+            "__sheet__": ["Sheet1", "Sheet1", "Sheet2", "Sheet2"],
+        }
     )
-    pd.testing.assert_frame_equal(result, expected)
+    pd.testing.assert_frame_equal(result, expected, check_exact=True, check_dtype=False)
 
 
-def test_read_excel_as_dict(tmp_path):
-    excel_file, df1, _ = _create_excel(tmp_path)
+def test_read_excel_as_dict(excel_workbook):
+    excel_file, _, _ = excel_workbook
     result = read_excel(excel_file, sheet_name="Sheet1", as_dict=True)
-    assert result == df1.to_dict(orient="records")
+    assert result == [{"A": 1, "B": "a"}, {"A": 2, "B": "b"}]
 
 
-def test_read_file_csv(tmp_path):
-    csv_file, df = _create_csv(tmp_path)
-    result = read_file(csv_file)
-    pd.testing.assert_frame_equal(result, df)
+def test_read_file_csv(csv_file):
+    path, df = csv_file
+    result = read_file(path)
+    pd.testing.assert_frame_equal(result, df, check_exact=True, check_dtype=False)
 
 
-def test_read_file_excel(tmp_path):
-    excel_file, _, df2 = _create_excel(tmp_path)
+def test_read_file_excel(excel_workbook):
+    excel_file, _, df2 = excel_workbook
     result = read_file(excel_file, sheet_name="Sheet2")
-    pd.testing.assert_frame_equal(result.reset_index(drop=True), df2)
+    pd.testing.assert_frame_equal(
+        result.reset_index(drop=True), df2, check_exact=True, check_dtype=False
+    )
 
 
 def test_read_file_invalid_extension(tmp_path):
@@ -1,9 +1,31 @@
 """
-Testing if we only keep 'E' vehicules in '.\data\resultat_simu_1.xlsx' file
+Testing that load_resultat_simu only keeps 'E' vehicules, against a tiny
+synthetic workbook instead of the multi-MB production file.
 """
-from src.utils import load_resultat_simu, DEFAULT_RESULTAT_SIMU
+import pytest
 
-def test_load_resultat_simu_filters_mode():
-    rows = load_resultat_simu(DEFAULT_RESULTAT_SIMU, mode="E")
+from openpyxl import Workbook
+
+from src.utils import load_resultat_simu
+
+
+@pytest.fixture(scope="session")
+def tiny_resultat(shared_tmp):
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["newIdVeh", "mode", "jourDep", "tVeh", "dist"])
+    ws.append(["V1", "E", 45000.5, "M1", 10])
+    ws.append(["V2", "T", 45001.0, "M2", 12])
+    ws.append(["V3", "E", 45001.5, "M1", 8])
+    ws.append(["V4", "T", 45002.0, "M3", 20])
+    ws.append(["V5", "E", 45002.5, "M2", 15])
+    path = shared_tmp / "resultat_simu.xlsx"
+    wb.save(path)
+    return path
+
+
+def test_load_resultat_simu_filters_mode(tiny_resultat):
+    rows = load_resultat_simu(tiny_resultat, mode="E")
     assert rows, "should load at least one row"
-    assert all(r.get("mode") == "E" for r in rows)
\ No newline at end of file
+    assert len(rows) == 3
+    assert all(r.get("mode") == "E" for r in rows)
@@ -1,8 +1,7 @@
-import os
-import sys
 import pytest
 
 
+import copy
 import json
 from pathlib import Path
 
@@ -10,7 +9,6 @@ from src.validator import validate_optim_dates, validate_json
 from src.mapper import _load_template, map_record
 
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from src.validator import validate_optim_dates
 
@@ -24,8 +22,11 @@ def test_validate_optim_dates_rejects_invalid_range():
     with pytest.raises(ValueError):
         validate_optim_dates("2024-12-17", "2024-12-18")
 
-def test_validate_json_accepts_template(tmp_path: Path):
-    record = {
+# Built once per module; tests deepcopy before mutating so the shared
+# dicts stay pristine across invocations.
+@pytest.fixture(scope="module")
+def base_record():
+    return {
         "newIdVeh": "1",
         "seqVoy": "1",
         "tVeh": "T",
@@ -36,7 +37,11 @@ def test_validate_json_accepts_template(tmp_path: Path):
         "MargeSécurité": 5,
         "Temps Déchargement": 10,
     }
-    infra = {
+
+
+@pytest.fixture(scope="module")
+def base_infra():
+    return {
         "sources": [
             {
                 "transformateurs": [
@@ -54,18 +59,31 @@ def test_validate_json_accepts_template(tmp_path: Path):
             }
         ]
     }
-    infra_path = tmp_path / "infra.json"
-    infra_path.write_text(json.dumps(infra))
-    
+
+
+@pytest.fixture(scope="module")
+def infra_json_path(shared_tmp, base_infra):
+    # Serialized once per module with compact separators; the tests only
+    # read the file back.
+    p = shared_tmp / "infra.json"
+    p.write_text(json.dumps(base_infra, separators=(",", ":")))
+    return p
+
+
+def test_validate_json_accepts_template(base_record, infra_json_path):
+    record = copy.deepcopy(base_record)
+    infra_path = infra_json_path
+    tpl = _load_template()
     data = map_record(
-        record, 
-        template=_load_template(),
+        record,
+        template=tpl,
         temps_chargement=20,
         temps_dechargement=10,
         infrastructure_path=infra_path,
     )
-    # fill in missing values so that validation passes
-    src = _load_template()["sources"][0]
+    # fill in missing values so that validation passes; deepcopy so the
+    # mutations below cannot alias the template still referenced above
+    src = copy.deepcopy(tpl["sources"][0])
     data["sources"] = [src]
     src["id"] = "SRC"
     src["libelle"] = "SRC"